@@ -5,10 +5,119 @@ This module provides functions to register DataFrames as SQL tables
 and execute SQL queries on medical data.
 """
 
-from typing import Union
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Union
+from uuid import uuid4
+from pyspark import inheritable_thread_target
 from pyspark.sql import DataFrame, SparkSession
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    from pyspark.sql.pandas.types import to_arrow_schema
+except ImportError:
+    pa = None
+
+# Rows per Arrow record batch when transferring query results to the driver
+ARROW_MAX_RECORDS_PER_BATCH = 100000
+
+# Scheduler pool for concurrently submitted analytics jobs (effective when
+# the application runs with spark.scheduler.mode=FAIR)
+ANALYTICS_SCHEDULER_POOL = "analytics"
+
+
+@contextmanager
+def _arrow_batch_size(spark: SparkSession) -> Iterator[None]:
+    """
+    Temporarily set the Arrow record batch size for collecting results.
+
+    The previous value is restored on exit, so pandas UDFs and other Arrow
+    conversions in the session keep their own batch size.
+
+    Parameters:
+    -----------
+    spark : SparkSession
+        Active Spark session
+    """
+    key = "spark.sql.execution.arrow.maxRecordsPerBatch"
+    previous = spark.conf.get(key, None)
+    spark.conf.set(key, ARROW_MAX_RECORDS_PER_BATCH)
+    try:
+        yield
+    finally:
+        if previous is None:
+            spark.conf.unset(key)
+        else:
+            spark.conf.set(key, previous)
+
+
+def _to_pandas(df: DataFrame) -> pd.DataFrame:
+    """
+    Convert a PySpark DataFrame to pandas via Arrow record batches.
+
+    Arrow buffers are released column by column while the pandas frame is
+    built (self_destruct), which keeps peak driver memory close to the size
+    of the result. Columns keep their Arrow representation (``pd.ArrowDtype``)
+    instead of NumPy object arrays for strings. Unlike ``toPandas()``,
+    timestamp columns are returned as timezone-aware Arrow timestamps rather
+    than being converted to naive local time.
+    Falls back to ``toPandas()`` if pyarrow is unavailable.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        PySpark DataFrame to convert
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Converted result
+    """
+    if pa is None:
+        return df.toPandas()
+
+    batches = df._collect_as_arrow(split_batches=True)
+    if batches:
+        table = pa.Table.from_batches(batches)
+    else:
+        # Zero-row result: build the empty frame from the schema
+        table = to_arrow_schema(df.schema).empty_table()
+    del batches
+    return table.to_pandas(
+        self_destruct=True,
+        split_blocks=True,
+        use_threads=True,
+        types_mapper=pd.ArrowDtype,
+    )
+
+
+def spark_to_arrow(df: DataFrame) -> "pa.Table":
+    """
+    Collect a PySpark DataFrame to the driver as a pyarrow Table.
+
+    Skips pandas entirely; use with the ``*_arrow`` chart builders.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        PySpark DataFrame to collect
+
+    Returns:
+    --------
+    pyarrow.Table
+        Collected data
+
+    Example:
+    --------
+    >>> table = spark_to_arrow(spark.sql("SELECT finding, COUNT(*) AS count ..."))
+    >>> ax = create_bar_chart_arrow(table, "finding", "count", "Диагнозы")
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to collect data as Arrow")
+    return df.toArrow()
+
 
 def register_table(df: DataFrame, table_name: str, replace: bool = True) -> None:
     """
@@ -60,7 +169,8 @@ def execute_query(
     Returns:
     --------
     DataFrame or pandas.DataFrame
-        Query result
+        Query result. pandas results have ``pd.ArrowDtype`` columns (with
+        timezone-aware timestamps) when pyarrow is available.
 
     Example:
     --------
@@ -72,25 +182,34 @@ def execute_query(
     df_result = spark.sql(query)
 
     if limit:
-        df_result = df_result.limit(limit)
+        # operator.index accepts NumPy integers; bool is an int subclass
+        if isinstance(limit, bool) or operator.index(limit) < 0:
+            raise ValueError(f"limit must be a non-negative integer, got {limit!r}")
+        df_result = df_result.limit(operator.index(limit))
 
     if to_pandas:
-        return df_result.toPandas()
+        with _arrow_batch_size(spark):
+            return _to_pandas(df_result)
     return df_result
 
 
 def execute_standard_analytics(
-    spark: SparkSession, table_name: str = "patients"
+    spark: SparkSession, table_name: str = "patients", max_workers: int = 5
 ) -> dict:
     """
     Execute a standard set of analytical queries for medical data.
 
+    The queries are submitted concurrently from a thread pool, so their
+    Spark jobs can share the cluster instead of running one after another.
+
     Parameters:
     -----------
     spark : SparkSession
         Active Spark session
     table_name : str, default "patients"
         Name of the registered table
+    max_workers : int, default 5
+        Maximum number of queries executed concurrently
 
     Returns:
     --------
@@ -102,68 +221,116 @@ def execute_standard_analytics(
     >>> results = execute_standard_analytics(spark, "patients")
     >>> print(results['diagnosis_summary'])
     """
-    results = {}
+    # Unique single-part view names: don't touch user views, don't collide
+    # with concurrent calls, and work for qualified table names (db.table)
+    suffix = uuid4().hex
+    cached_view = f"__patients_cached_{suffix}"
+    grouped_view = f"__patients_finding_age_{suffix}"
+
+    queries = {}
 
     # Query 1: Basic statistics by diagnosis
-    query1 = f"""
+    queries["diagnosis_summary"] = f"""
     SELECT finding,
-           COUNT(*) as patient_count,
-           AVG(age) as avg_age,
+           SUM(c) as patient_count,
+           SUM(age * c) / SUM(CASE WHEN age IS NOT NULL THEN c END) as avg_age,
            MIN(age) as min_age,
            MAX(age) as max_age
-    FROM {table_name}
+    FROM {grouped_view}
     GROUP BY finding
     ORDER BY patient_count DESC
     """
-    results["diagnosis_summary"] = execute_query(spark, query1)
 
     # Query 2: Distribution by gender and diagnosis
-    query2 = f"""
+    queries["gender_diagnosis"] = f"""
     SELECT sex,
            finding,
            COUNT(*) as count
-    FROM {table_name}
+    FROM {cached_view}
     GROUP BY sex, finding
     ORDER BY sex, finding
     """
-    results["gender_diagnosis"] = execute_query(spark, query2)
 
     # Query 3: Top N ages per diagnosis
-    query3 = f"""
-    SELECT finding, age, COUNT(*) as patient_count
+    queries["top_ages_per_diagnosis"] = f"""
+    SELECT finding, age, patient_count
     FROM (
-        SELECT finding, age, COUNT(*) as patient_count,
-               ROW_NUMBER() OVER (PARTITION BY finding ORDER BY COUNT(*) DESC) as rn
-        FROM {table_name}
-        GROUP BY finding, age
+        SELECT finding, age, c as patient_count,
+               ROW_NUMBER() OVER (PARTITION BY finding ORDER BY c DESC) as rn
+        FROM {grouped_view}
     )
     WHERE rn <= 5
     ORDER BY finding, patient_count DESC
     """
-    results["top_ages_per_diagnosis"] = execute_query(spark, query3)
 
     # Query 4: Temporal trends
-    query4 = f"""
+    queries["temporal_trends"] = f"""
     SELECT finding,
            YEAR(date) as year,
            MONTH(date) as month,
            COUNT(*) as count
-    FROM {table_name}
+    FROM {cached_view}
     WHERE date IS NOT NULL
     GROUP BY finding, YEAR(date), MONTH(date)
     ORDER BY finding, year, month
     """
-    results["temporal_trends"] = execute_query(spark, query4)
 
     # Query 5: Projection view statistics
-    query5 = f"""
+    queries["view_diagnosis"] = f"""
     SELECT view,
            finding,
            COUNT(*) as count
-    FROM {table_name}
+    FROM {cached_view}
     GROUP BY view, finding
     ORDER BY view, finding
     """
-    results["view_diagnosis"] = execute_query(spark, query5)
+
+    @inheritable_thread_target
+    def run_query(query: str) -> pd.DataFrame:
+        # Workers inherit the caller's local properties (job group,
+        # description); the scheduler pool is set on top of them
+        spark.sparkContext.setLocalProperty(
+            "spark.scheduler.pool", ANALYTICS_SCHEDULER_POOL
+        )
+        return _to_pandas(spark.sql(query))
+
+    base = grouped = None
+    try:
+        # Scan the source table once: cache only the columns used by the queries
+        base = (
+            spark.table(table_name)
+            .select("finding", "age", "sex", "view", "date")
+            .cache()
+        )
+        base.count()
+        base.createOrReplaceTempView(cached_view)
+
+        # Shared (finding, age) aggregate for the diagnosis summary and top ages
+        grouped = spark.sql(
+            f"""
+            SELECT finding, age, COUNT(*) as c
+            FROM {cached_view}
+            GROUP BY finding, age
+            """
+        ).cache()
+        # Materialize before the concurrent queries so they don't compute it twice
+        grouped.count()
+        grouped.createOrReplaceTempView(grouped_view)
+
+        with _arrow_batch_size(spark), ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {
+                name: executor.submit(run_query, query)
+                for name, query in queries.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+    finally:
+        if grouped is not None:
+            grouped.unpersist()
+        if base is not None:
+            base.unpersist()
+        spark.catalog.dropTempView(grouped_view)
+        spark.catalog.dropTempView(cached_view)
 
     return results
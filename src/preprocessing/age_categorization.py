@@ -1,43 +1,45 @@
 """
-Модуль для категоризации возраста пациентов с использованием PySpark UDF.
+Модуль для категоризации возраста пациентов средствами PySpark.
 
-Предоставляет пользовательскую функцию (UDF) для распределения пациентов
-по возрастным группам для последующего анализа данных.
+Предоставляет выражение Spark SQL (Column) для распределения пациентов
+по возрастным группам для последующего анализа данных, а также
+векторизованную pandas UDF с тем же поведением для обратной совместимости.
 """
 
-from pyspark.sql.functions import udf
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from pyspark.sql import Column
+from pyspark.sql import functions as F
+from pyspark.sql.functions import pandas_udf
 from pyspark.sql.types import StringType
 
 
-@udf(StringType())
-def categorize_age(age: int) -> str:
+def categorize_age_expr(age: Column) -> Column:
     """
-    Категоризирует возраст пациента в одну из трёх групп.
+    Строит выражение Spark SQL для категоризации возраста пациента.
 
-    Функция разделяет пациентов на возрастные категории для проведения
-    статистического анализа и построения визуализаций.
+    Выражение вычисляется целиком внутри движка Catalyst (JVM), без
+    сериализации строк и передачи данных в процесс Python, поэтому
+    предпочтительнее UDF ``categorize_age``.
 
     Категории:
         - "Junior": пациенты младше 30 лет
         - "Middle": пациенты от 30 до 59 лет
         - "Senior": пациенты 60 лет и старше
+        - null: если возраст не указан
 
     Args:
-        age (int): Возраст пациента в годах.
+        age (Column): Столбец с возрастом пациента в годах.
 
     Returns:
-        str: Категория возраста ("Junior", "Middle" или "Senior").
+        Column: Столбец с категорией возраста ("Junior", "Middle" или "Senior").
 
     Examples:
         >>> from pyspark.sql.functions import col
-        >>> from pyspark.sql import SparkSession
-        >>>
-        >>> # Создание тестового DataFrame
-        >>> spark = SparkSession.builder.appName("Test").getOrCreate()
         >>> df = spark.createDataFrame([(25,), (45,), (70,)], ["age"])
-        >>>
-        >>> # Применение UDF для категоризации возраста
-        >>> df = df.withColumn("age_group", categorize_age(col("age")))
+        >>> df = df.withColumn("age_group", categorize_age_expr(col("age")))
         >>> df.show()
         +---+---------+
         |age|age_group|
@@ -47,22 +49,75 @@ def categorize_age(age: int) -> str:
         | 70|  Senior|
         +---+---------+
     """
-    if age is None:
-        return None
+    return (
+        F.when(age.isNull(), F.lit(None).cast(StringType()))
+        .when(age < 30, F.lit("Junior"))
+        .when(age < 60, F.lit("Middle"))
+        .otherwise(F.lit("Senior"))
+    )
+
+
+def _categorize_age_batch(age: pd.Series) -> pd.Series:
+    """
+    Категоризирует пакет значений возраста (тело pandas UDF categorize_age).
+
+    Args:
+        age (pd.Series): Пакет значений возраста пациентов в годах.
+
+    Returns:
+        pd.Series: Категории возраста; None для пропущенных значений.
+    """
+    groups = np.select([age < 30, age < 60], ["Junior", "Middle"], default="Senior")
+    return pd.Series(groups, index=age.index, dtype=object).where(age.notna(), None)
+
+
+@lru_cache(maxsize=None)
+def _categorize_age_udf():
+    """
+    Создаёт pandas UDF при первом использовании.
 
-    if age < 30:
-        return "Junior"
-    elif age < 60:
-        return "Middle"
-    else:
-        return "Senior"
+    ``pandas_udf`` требует pyarrow уже при создании, поэтому UDF не
+    создаётся при импорте модуля: без pyarrow остаётся доступным
+    ``categorize_age_expr``.
+    """
+    return pandas_udf(_categorize_age_batch, StringType())
+
+
+def categorize_age(age: Column) -> Column:
+    """
+    Категоризирует возраст пациента в одну из трёх групп.
+
+    Векторизованная (Arrow) pandas UDF, сохранённая для обратной
+    совместимости: данные передаются пакетами Arrow, размер которых задаётся
+    параметром ``spark.sql.execution.arrow.maxRecordsPerBatch``. Требует
+    pyarrow. Для новых вызовов используйте ``categorize_age_expr``, которое
+    не требует Python.
+
+    Категории:
+        - "Junior": пациенты младше 30 лет
+        - "Middle": пациенты от 30 до 59 лет
+        - "Senior": пациенты 60 лет и старше
+
+    Args:
+        age (Column): Столбец с возрастом пациента в годах.
+
+    Returns:
+        Column: Столбец с категорией возраста ("Junior", "Middle" или "Senior");
+        для пропущенных значений возраста возвращается null.
+
+    Examples:
+        >>> from pyspark.sql.functions import col
+        >>> df = spark.createDataFrame([(25,), (45,), (70,)], ["age"])
+        >>> df = df.withColumn("age_group", categorize_age(col("age")))
+    """
+    return _categorize_age_udf()(age)
 
 
 # Пример использования в DataFrame:
 # from pyspark.sql.functions import col
 #
-# # Применение UDF к DataFrame с возрастами пациентов
-# df = df.withColumn("age_group", categorize_age(col("age")))
+# # Применение выражения к DataFrame с возрастами пациентов
+# df = df.withColumn("age_group", categorize_age_expr(col("age")))
 #
 # # Проверка результата
 # df.select("age", "age_group").show()
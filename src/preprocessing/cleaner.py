@@ -5,9 +5,110 @@ This module provides functions to clean and standardize medical data,
 including removing duplicates, handling outliers, and standardizing categorical values.
 """
 
-from typing import Optional
-from pyspark.sql import DataFrame
+import logging
+from typing import Dict, Optional
+from pyspark.sql import Column, DataFrame
 from pyspark.sql import functions as F
+from src.preprocessing.schema_utils import row_hash
+
+logger = logging.getLogger(__name__)
+
+
+def _count_removed_rows(
+    df: DataFrame, remove_duplicates: bool, outlier_conditions: Dict[str, Column]
+) -> Dict[str, int]:
+    """
+    Count rows removed by each cleaning step with a single Spark job.
+
+    Outlier filters are evaluated in order, so each column is credited only
+    with rows that passed all previous filters (matching the sequential
+    filtering in clean_data). Duplicates are identified by a 64-bit row hash;
+    this only affects the reported numbers (a hash collision would skew the
+    count), while clean_data itself removes duplicates exactly.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        Input PySpark DataFrame (before cleaning)
+    remove_duplicates : bool
+        Whether duplicate rows are removed before outlier filtering
+    outlier_conditions : dict
+        Ordered mapping of column names to the filter condition that keeps a row
+
+    Returns:
+    --------
+    dict
+        Number of removed rows under the "duplicates" key and per outlier column
+    """
+    if remove_duplicates:
+        # Group by row hash, carrying only the columns the filters need
+        rows_df = (
+            df.withColumn("__row_hash", row_hash(df))
+            .groupBy("__row_hash")
+            .agg(
+                F.count(F.lit(1)).alias("__rows"),
+                *[F.first(column).alias(column) for column in outlier_conditions],
+            )
+        )
+    else:
+        rows_df = df.withColumn("__rows", F.lit(1))
+
+    aggs = [
+        F.sum("__rows").alias("__total"),
+        F.count(F.lit(1)).alias("__distinct"),
+    ]
+    kept = F.lit(True)
+    for index, condition in enumerate(outlier_conditions.values()):
+        condition = F.coalesce(condition, F.lit(False))
+        aggs.append(F.count(F.when(kept & ~condition, 1)).alias(f"__dropped_{index}"))
+        kept = kept & condition
+
+    row = rows_df.agg(*aggs).collect()[0]
+
+    removed = {"duplicates": (row["__total"] or 0) - row["__distinct"]}
+    for index, column in enumerate(outlier_conditions):
+        removed[column] = row[f"__dropped_{index}"]
+    return removed
+
+
+def _standardize_expr(column: Column, rules: dict) -> Column:
+    """
+    Build a single expression applying category standardization rules.
+
+    Literal-only rules become one map lookup; otherwise the rules are folded
+    into one F.when chain in which the first matching rule wins.
+
+    Parameters:
+    -----------
+    column : Column
+        Column to standardize
+    rules : dict
+        Mapping of patterns (literal values or callables taking a Column and
+        returning a boolean Column) to standardized values
+
+    Returns:
+    --------
+    Column
+        Standardized column (unmatched values are kept as is)
+    """
+    literal_only = all(
+        not callable(pattern) and pattern is not None and value is not None
+        for pattern, value in rules.items()
+    )
+    if literal_only:
+        mapping = F.create_map(
+            *[F.lit(item) for pair in rules.items() for item in pair]
+        )
+        return F.coalesce(mapping[column], column)
+
+    expr = None
+    for pattern, standardized_value in rules.items():
+        condition = pattern(column) if callable(pattern) else column == pattern
+        if expr is None:
+            expr = F.when(condition, standardized_value)
+        else:
+            expr = expr.when(condition, standardized_value)
+    return expr.otherwise(column)
 
 
 def clean_data(
@@ -31,6 +132,13 @@ def clean_data(
     standardize_categories : dict, optional
         Dictionary mapping column names to standardization rules
         Example: {"finding": {"COVID": "COVID-19", "Pneumonia": "Pneumonia"}}
+        Rules for a column are evaluated against the original value and the
+        first matching rule wins; a rule does not see the output of earlier
+        rules, so chained rewrites (A -> B, B -> C) map A to B, not C.
+        Rules made only of literal keys and values are applied as a single
+        map lookup (F.create_map): the keys must coerce to one common type,
+        and keys that become equal after coercion (e.g. 1 and "1") raise a
+        duplicate map key error.
 
     Returns:
     --------
@@ -54,39 +162,34 @@ def clean_data(
 
     # Remove duplicates
     if remove_duplicates:
-        initial_count = cleaned_df.count()
         cleaned_df = cleaned_df.dropDuplicates()
-        final_count = cleaned_df.count()
-        print(f"Removed {initial_count - final_count} duplicate rows")
 
     # Remove outliers
+    outlier_conditions = {}
     if remove_outliers:
         for column, (lower_bound, upper_bound) in remove_outliers.items():
-            initial_count = cleaned_df.count()
-            cleaned_df = cleaned_df.filter(
-                (F.col(column) >= lower_bound) & (F.col(column) <= upper_bound)
-            )
-            final_count = cleaned_df.count()
-            print(f"Removed {initial_count - final_count} outliers from {column}")
+            condition = (F.col(column) >= lower_bound) & (F.col(column) <= upper_bound)
+            outlier_conditions[column] = condition
+            cleaned_df = cleaned_df.filter(condition)
+
+    # Report removed rows, computed in a single pass over the input; the
+    # counting job only runs when the report will actually be logged
+    if (remove_duplicates or outlier_conditions) and logger.isEnabledFor(
+        logging.INFO
+    ):
+        removed = _count_removed_rows(df, remove_duplicates, outlier_conditions)
+        if remove_duplicates:
+            logger.info("Removed %d duplicate rows", removed["duplicates"])
+        if outlier_conditions:
+            summary = [(column, removed[column]) for column in outlier_conditions]
+            logger.info("Outlier removal (column, removed rows): %s", summary)
 
     # Standardize categories
     if standardize_categories:
         for column, rules in standardize_categories.items():
-            if column in cleaned_df.columns:
-                for pattern, standardized_value in rules.items():
-                    if callable(pattern):
-                        cleaned_df = cleaned_df.withColumn(
-                            column,
-                            F.when(
-                                pattern(F.col(column)), standardized_value
-                            ).otherwise(F.col(column)),
-                        )
-                    else:
-                        cleaned_df = cleaned_df.withColumn(
-                            column,
-                            F.when(
-                                F.col(column) == pattern, standardized_value
-                            ).otherwise(F.col(column)),
-                        )
+            if column in cleaned_df.columns and rules:
+                cleaned_df = cleaned_df.withColumn(
+                    column, _standardize_expr(F.col(column), rules)
+                )
 
     return cleaned_df
@@ -7,10 +7,47 @@ including CSV, Parquet, JSON, and other PySpark-supported formats.
 
 from typing import Optional
 import os
+import warnings
 from pyspark.sql import SparkSession, DataFrame
 from pyspark.sql.types import StructType
 
 
+def persist_as_parquet(
+    df: DataFrame, cache_path: str, compression: str = "snappy"
+) -> DataFrame:
+    """
+    Write a DataFrame to Parquet and return a DataFrame reading it back.
+
+    Subsequent operations on the returned DataFrame read the columnar copy
+    (with projection and predicate pushdown) instead of recomputing the
+    original lineage or re-parsing the source file. Use it once after
+    cleaning and missing value handling, before registering the SQL view.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        PySpark DataFrame to materialize
+    cache_path : str
+        Output directory for the Parquet files (overwritten if it exists)
+    compression : str, default "snappy"
+        Parquet compression codec
+
+    Returns:
+    --------
+    DataFrame
+        PySpark DataFrame backed by the Parquet copy
+
+    Example:
+    --------
+    >>> df = clean_data(df)
+    >>> df = handle_missing_values(df, strategy="median")
+    >>> df = persist_as_parquet(df, "data/cache/patients.parquet")
+    >>> register_table(df, "patients")
+    """
+    df.write.mode("overwrite").option("compression", compression).parquet(cache_path)
+    return df.sparkSession.read.parquet(cache_path)
+
+
 def load_dataset(
     spark: SparkSession,
     file_path: str,
@@ -19,6 +56,7 @@ def load_dataset(
     infer_schema: bool = True,
     schema: Optional[StructType] = None,
     mode: str = "PERMISSIVE",
+    cache_path: Optional[str] = None,
     **kwargs,
 ) -> DataFrame:
     """
@@ -40,6 +78,12 @@ def load_dataset(
         Explicit schema definition (recommended for CSV files to avoid warnings)
     mode : str, default "PERMISSIVE"
         Error handling mode (PERMISSIVE, DROPMALFORMED, FAILFAST)
+    cache_path : str, optional
+        Parquet cache directory. If it holds a completed write (a _SUCCESS
+        marker), the dataset is read from it instead of file_path; otherwise
+        the loaded dataset is (re)written there
+        so that subsequent loads skip parsing (and schema inference) of the
+        source file. Delete the directory to pick up changes in the source.
     **kwargs : dict
         Additional parameters passed to Spark reader
 
@@ -57,11 +101,31 @@ def load_dataset(
     >>> from pyspark.sql.types import StructType, StructField, StringType
     >>> schema = StructType([StructField("patientid", StringType(), True)])
     >>> df = load_dataset(spark, "data/raw/metadata.csv", schema=schema)
+
+    >>> # Parse the CSV once, read the Parquet copy on subsequent loads:
+    >>> df = load_dataset(
+    ...     spark, "data/raw/metadata.csv", cache_path="data/cache/metadata.parquet"
+    ... )
     """
+    # Only trust a cache whose write completed (Spark writes _SUCCESS last);
+    # an incomplete one is rebuilt below
+    if cache_path is not None and os.path.exists(
+        os.path.join(cache_path, "_SUCCESS")
+    ):
+        spark.conf.set("spark.sql.parquet.enableVectorizedReader", "true")
+        return spark.read.parquet(cache_path)
+
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
     if format == "csv":
+        if schema is None and infer_schema:
+            warnings.warn(
+                "No schema provided for CSV: schema inference requires an extra "
+                "full pass over the file. Pass an explicit schema or cache_path "
+                "to avoid it on repeated loads.",
+                stacklevel=2,
+            )
         # Use explicit schema if provided, otherwise infer schema
         df = spark.read.csv(
             file_path,
@@ -73,6 +137,7 @@ def load_dataset(
             **kwargs,
         )
     elif format == "parquet":
+        spark.conf.set("spark.sql.parquet.enableVectorizedReader", "true")
         df = spark.read.parquet(file_path, **kwargs)
     elif format == "json":
         df = spark.read.json(file_path, **kwargs)
@@ -83,4 +148,7 @@ def load_dataset(
     else:
         raise ValueError(f"Unsupported format: {format}")
 
+    if cache_path is not None:
+        df = persist_as_parquet(df, cache_path)
+
     return df
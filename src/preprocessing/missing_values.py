@@ -5,10 +5,14 @@ This module provides functions to handle missing values in medical data,
 including filling with statistics, dropping, and imputation strategies.
 """
 
+import logging
 from typing import Optional, Dict, Any
+from pyspark import StorageLevel
 from pyspark.sql import DataFrame
 from pyspark.sql import functions as F
-from pyspark.sql.types import NumericType
+from src.preprocessing.schema_utils import get_numeric_columns
+
+logger = logging.getLogger(__name__)
 
 
 def handle_missing_values(
@@ -53,62 +57,64 @@ def handle_missing_values(
     # Drop rows with too many missing values if threshold specified
     if drop_threshold is not None and 0 <= drop_threshold <= 1:
         total_columns = len(filled_df.columns)
-        null_counts = sum(
-            [F.when(F.col(c).isNull(), 1).otherwise(0) for c in filled_df.columns]
+        null_counts = F.aggregate(
+            F.array(*[F.col(c).isNull().cast("int") for c in filled_df.columns]),
+            F.lit(0),
+            lambda acc, x: acc + x,
         )
         filled_df = filled_df.filter((null_counts / total_columns) <= drop_threshold)
-        print(f"Dropped rows with >{drop_threshold*100}% missing values")
+        logger.info("Dropped rows with >%s%% missing values", drop_threshold * 100)
 
     # Apply fill values if provided
     if fill_values:
         filled_df = filled_df.na.fill(fill_values)
-        print(
-            f"Filled missing values with custom values for columns: {list(fill_values.keys())}"
+        logger.info(
+            "Filled missing values with custom values for columns: %s",
+            list(fill_values.keys()),
         )
 
     # Handle missing values based on strategy
     if strategy == "drop":
-        initial_count = filled_df.count()
+        # Counts only feed the log message: skip them unless it is emitted
+        if logger.isEnabledFor(logging.INFO):
+            # Both counts read the same lineage: materialize it once
+            filled_df = filled_df.persist(StorageLevel.MEMORY_AND_DISK)
+            initial_count = filled_df.count()
+            final_count = filled_df.na.drop().count()
+            filled_df.unpersist()
+            logger.info(
+                "Dropped %d rows with missing values", initial_count - final_count
+            )
         filled_df = filled_df.na.drop()
-        final_count = filled_df.count()
-        print(f"Dropped {initial_count - final_count} rows with missing values")
 
     elif strategy == "zero":
         # Fill numeric columns with 0
-        numeric_columns = [
-            field.name
-            for field in filled_df.schema.fields
-            if isinstance(field.dataType, NumericType)
-        ]
+        numeric_columns = get_numeric_columns(filled_df)
         if numeric_columns:
             filled_df = filled_df.na.fill({col: 0 for col in numeric_columns})
-            print(
-                f"Filled numeric missing values with 0 for columns: {numeric_columns}"
+            logger.info(
+                "Filled numeric missing values with 0 for columns: %s", numeric_columns
             )
 
     elif strategy in ["median", "mean", "mode"]:
         # Calculate and fill with statistics for numeric columns
-        numeric_columns = [
-            field.name
-            for field in filled_df.schema.fields
-            if isinstance(field.dataType, NumericType)
-        ]
-
-        for column in numeric_columns:
-            if strategy == "median":
-                stat_value = filled_df.select(F.median(column)).collect()[0][0]
-            elif strategy == "mean":
-                stat_value = filled_df.select(F.mean(column)).collect()[0][0]
-            elif strategy == "mode":
-                stat_value = (
-                    filled_df.groupBy(column)
-                    .count()
-                    .orderBy(F.desc("count"))
-                    .first()[0]
-                )
-
-            if stat_value is not None:
-                filled_df = filled_df.na.fill({column: stat_value})
-                print(f"Filled {column} missing values with {strategy}: {stat_value}")
+        numeric_columns = get_numeric_columns(filled_df)
+
+        if numeric_columns:
+            # Compute the statistic for all numeric columns in a single job
+            stat_functions = {"median": F.median, "mean": F.mean, "mode": F.mode}
+            stat_function = stat_functions[strategy]
+            stats = filled_df.agg(
+                *[stat_function(column).alias(column) for column in numeric_columns]
+            ).collect()[0]
+
+            fill_map = {
+                column: stats[column]
+                for column in numeric_columns
+                if stats[column] is not None
+            }
+            if fill_map:
+                filled_df = filled_df.na.fill(fill_map)
+                logger.info("Filled missing values with %s: %s", strategy, fill_map)
 
     return filled_df
@@ -5,10 +5,11 @@ This module provides functions to assess data quality including completeness,
 consistency, validity, and accuracy metrics.
 """
 
+import io
 from typing import Dict, List
 from pyspark.sql import DataFrame
 from pyspark.sql import functions as F
-from pyspark.sql.types import NumericType
+from src.preprocessing.schema_utils import get_numeric_columns, row_hash
 
 
 def assess_quality(df: DataFrame) -> Dict[str, any]:
@@ -39,15 +40,33 @@ def assess_quality(df: DataFrame) -> Dict[str, any]:
     """
     metrics = {}
 
+    numeric_columns = get_numeric_columns(df)
+
+    # Counts, null counts per column and numeric statistics in a single pass
+    aggs = [
+        F.count(F.lit(1)).alias("__total"),
+        F.countDistinct(row_hash(df)).alias("__distinct"),
+    ]
+    aggs += [
+        F.count(F.when(F.col(column).isNull(), 1)).alias(f"__n_{column}")
+        for column in df.columns
+    ]
+    for column in numeric_columns:
+        aggs += [
+            F.count(column).alias(f"__cnt_{column}"),
+            F.mean(column).alias(f"__mean_{column}"),
+            F.stddev(column).alias(f"__std_{column}"),
+            F.min(column).alias(f"__min_{column}"),
+            F.max(column).alias(f"__max_{column}"),
+        ]
+    row = df.agg(*aggs).collect()[0]
+
     # Basic counts
-    metrics["total_records"] = df.count()
+    metrics["total_records"] = row["__total"]
     metrics["total_columns"] = len(df.columns)
 
     # Missing values per column
-    missing_values = {}
-    for column in df.columns:
-        null_count = df.filter(F.col(column).isNull()).count()
-        missing_values[column] = null_count
+    missing_values = {column: row[f"__n_{column}"] for column in df.columns}
     metrics["missing_values"] = missing_values
 
     # Overall completeness percentage
@@ -57,7 +76,7 @@ def assess_quality(df: DataFrame) -> Dict[str, any]:
     metrics["completeness_percentage"] = round(completeness, 2)
 
     # Duplicate rows
-    metrics["duplicate_rows"] = df.count() - df.dropDuplicates().count()
+    metrics["duplicate_rows"] = metrics["total_records"] - row["__distinct"]
 
     # Column data types
     metrics["column_types"] = {
@@ -65,28 +84,16 @@ def assess_quality(df: DataFrame) -> Dict[str, any]:
     }
 
     # Numeric column summary
-    numeric_columns = [
-        field.name
-        for field in df.schema.fields
-        if isinstance(field.dataType, NumericType)
-    ]
-
     numeric_summary = {}
     for column in numeric_columns:
-        stats = df.select(
-            F.count(column).alias("count"),
-            F.mean(column).alias("mean"),
-            F.stddev(column).alias("stddev"),
-            F.min(column).alias("min"),
-            F.max(column).alias("max"),
-        ).collect()[0]
-
+        mean = row[f"__mean_{column}"]
+        stddev = row[f"__std_{column}"]
         numeric_summary[column] = {
-            "count": stats["count"],
-            "mean": round(stats["mean"], 2) if stats["mean"] else None,
-            "stddev": round(stats["stddev"], 2) if stats["stddev"] else None,
-            "min": stats["min"],
-            "max": stats["max"],
+            "count": row[f"__cnt_{column}"],
+            "mean": round(mean, 2) if mean is not None else None,
+            "stddev": round(stddev, 2) if stddev is not None else None,
+            "min": row[f"__min_{column}"],
+            "max": row[f"__max_{column}"],
         }
     metrics["numeric_summary"] = numeric_summary
 
@@ -102,28 +109,33 @@ def print_quality_report(metrics: Dict[str, any]) -> None:
     metrics : dict
         Quality metrics dictionary from assess_quality()
     """
-    print("=" * 60)
-    print("DATA QUALITY ASSESSMENT REPORT")
-    print("=" * 60)
+    # Build the whole report first and write it to stdout in one call
+    report = io.StringIO()
 
-    print(f"\n📊 Total Records: {metrics['total_records']:,}")
-    print(f"📋 Total Columns: {metrics['total_columns']}")
-    print(f"✅ Completeness: {metrics['completeness_percentage']}%")
-    print(f"🔄 Duplicate Rows: {metrics['duplicate_rows']:,}")
+    print("=" * 60, file=report)
+    print("DATA QUALITY ASSESSMENT REPORT", file=report)
+    print("=" * 60, file=report)
 
-    print("\n--- Missing Values by Column ---")
+    print(f"\n📊 Total Records: {metrics['total_records']:,}", file=report)
+    print(f"📋 Total Columns: {metrics['total_columns']}", file=report)
+    print(f"✅ Completeness: {metrics['completeness_percentage']}%", file=report)
+    print(f"🔄 Duplicate Rows: {metrics['duplicate_rows']:,}", file=report)
+
+    print("\n--- Missing Values by Column ---", file=report)
     for column, count in metrics["missing_values"].items():
         if count > 0:
             percentage = (count / metrics["total_records"]) * 100
-            print(f"{column}: {count:,} ({percentage:.2f}%)")
+            print(f"{column}: {count:,} ({percentage:.2f}%)", file=report)
 
     if metrics["numeric_summary"]:
-        print("\n--- Numeric Column Statistics ---")
+        print("\n--- Numeric Column Statistics ---", file=report)
         for column, stats in metrics["numeric_summary"].items():
-            print(f"\n{column}:")
-            print(f"  Count: {stats['count']:,}")
-            print(f"  Mean: {stats['mean']}")
-            print(f"  Std Dev: {stats['stddev']}")
-            print(f"  Range: [{stats['min']}, {stats['max']}]")
+            print(f"\n{column}:", file=report)
+            print(f"  Count: {stats['count']:,}", file=report)
+            print(f"  Mean: {stats['mean']}", file=report)
+            print(f"  Std Dev: {stats['stddev']}", file=report)
+            print(f"  Range: [{stats['min']}, {stats['max']}]", file=report)
+
+    print("\n" + "=" * 60, file=report)
 
-    print("\n" + "=" * 60)
+    print(report.getvalue(), end="")
@@ -0,0 +1,87 @@
+"""
+Schema helper module for medical datasets.
+
+This module provides helpers over DataFrame columns shared by the
+preprocessing and quality assessment modules: cached classification of
+columns by data type and a whole-row hash expression.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+from pyspark.sql import Column, DataFrame
+from pyspark.sql import functions as F
+from pyspark.sql.types import DataType, NumericType
+
+
+@lru_cache(maxsize=128)
+def _numeric_cols_cached(schema_key: Tuple[Tuple[str, DataType], ...]) -> List[str]:
+    """
+    Select numeric column names from a hashable schema key.
+
+    Parameters:
+    -----------
+    schema_key : tuple
+        Tuple of (column name, data type) pairs
+
+    Returns:
+    --------
+    list
+        Names of numeric columns, in schema order
+    """
+    return [
+        name for name, data_type in schema_key if isinstance(data_type, NumericType)
+    ]
+
+
+def get_numeric_columns(df: DataFrame) -> List[str]:
+    """
+    Get the names of numeric columns of a DataFrame.
+
+    Results are cached per schema, so repeated calls on DataFrames with the
+    same schema do not re-classify every column.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        Input PySpark DataFrame
+
+    Returns:
+    --------
+    list
+        Names of numeric columns, in schema order
+
+    Example:
+    --------
+    >>> get_numeric_columns(df)
+    ['offset', 'age', 'temperature']
+    """
+    schema_key = tuple((field.name, field.dataType) for field in df.schema.fields)
+    return list(_numeric_cols_cached(schema_key))
+
+
+def row_hash(df: DataFrame) -> Column:
+    """
+    Build a 64-bit hash expression over all columns of a DataFrame.
+
+    Spark's hash functions skip null values, so rows such as (NULL, "a") and
+    ("a", NULL) would hash equally; per-column null flags are hashed as well
+    to tell them apart.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        Input PySpark DataFrame
+
+    Returns:
+    --------
+    Column
+        xxhash64 of the row values and their null flags
+
+    Example:
+    --------
+    >>> distinct_rows = df.select(F.countDistinct(row_hash(df))).first()[0]
+    """
+    return F.xxhash64(
+        *[F.col(column) for column in df.columns],
+        *[F.col(column).isNull() for column in df.columns],
+    )
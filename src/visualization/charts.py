@@ -11,11 +11,69 @@ import seaborn as sns
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Arguments of the last applied set_style() call
+_STYLE_APPLIED = None
+
+
+def _numpy_frame(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Select columns from a (possibly Arrow-backed) DataFrame as NumPy arrays.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data to visualize
+    columns : list of str
+        Column names to keep
+
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with NumPy-backed columns
+    """
+    return pd.DataFrame(
+        {column: np.asarray(df[column]) for column in columns}, copy=False
+    )
+
+
+def _arrow_numpy_frame(table: "pa.Table", columns: List[str]) -> pd.DataFrame:
+    """
+    Wrap columns of a pyarrow Table as a NumPy-backed DataFrame.
+
+    Each column is converted to NumPy once (zero-copy for numeric columns
+    without nulls); the DataFrame only wraps the resulting arrays.
+
+    Parameters:
+    -----------
+    table : pa.Table
+        Data to visualize
+    columns : list of str
+        Column names to keep
+
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with NumPy-backed columns
+    """
+    return pd.DataFrame(
+        {column: table.column(column).to_numpy() for column in columns},
+        copy=False,
+    )
+
 
 def set_style(style: str = "whitegrid", font_scale: float = 1.2) -> None:
     """
     Set the visualization style.
 
+    Applying a seaborn theme rebuilds the global rcParams, so the theme is
+    applied only when the arguments differ from the last call. Call it once
+    before drawing; the chart builders call it too, which is then a no-op.
+
     Parameters:
     -----------
     style : str, default "whitegrid"
@@ -23,8 +81,13 @@ def set_style(style: str = "whitegrid", font_scale: float = 1.2) -> None:
     font_scale : float, default 1.2
         Font scale for text elements
     """
-    sns.set_theme(style=style)
-    sns.set(font_scale=font_scale)
+    global _STYLE_APPLIED
+
+    if _STYLE_APPLIED == (style, font_scale):
+        return
+
+    sns.set_theme(style=style, font_scale=font_scale)
+    _STYLE_APPLIED = (style, font_scale)
 
 
 def create_bar_chart(
@@ -76,7 +139,9 @@ def create_bar_chart(
 
     fig, ax = plt.subplots(figsize=figsize)
 
-    bars = ax.bar(df[x], df[y], color=color)
+    xv = np.asarray(df[x])
+    yv = np.asarray(df[y])
+    bars = ax.bar(xv, yv, color=color)
 
     ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
     ax.set_xlabel(xlabel if xlabel else x, fontsize=12)
@@ -85,22 +150,60 @@ def create_bar_chart(
     plt.xticks(rotation=rotation, ha="right")
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height,
-            f"{int(height):,}",
-            ha="center",
-            va="bottom",
-            fontsize=10,
-        )
+    ax.bar_label(bars, labels=[f"{int(height):,}" for height in yv], fontsize=10)
 
     plt.tight_layout()
 
     return ax
 
 
+def create_bar_chart_arrow(
+    table: "pa.Table",
+    x: str,
+    y: str,
+    title: str,
+    xlabel: Optional[str] = None,
+    ylabel: Optional[str] = None,
+    figsize: tuple = (12, 6),
+    color: Optional[str] = None,
+    rotation: int = 45,
+) -> plt.Axes:
+    """
+    Create a bar chart from a pyarrow Table (see create_bar_chart).
+
+    Only the x and y columns are converted to NumPy; no pandas conversion
+    of the whole table takes place.
+
+    Parameters:
+    -----------
+    table : pa.Table
+        Data to visualize, e.g. from spark_to_arrow()
+    x, y, title, xlabel, ylabel, figsize, color, rotation :
+        Same as in create_bar_chart
+
+    Returns:
+    --------
+    plt.Axes
+        Matplotlib axes object
+
+    Example:
+    --------
+    >>> table = spark_to_arrow(spark.sql(query))
+    >>> ax = create_bar_chart_arrow(table, "finding", "count", "Распределение диагнозов")
+    """
+    return create_bar_chart(
+        _arrow_numpy_frame(table, [x, y]),
+        x,
+        y,
+        title,
+        xlabel=xlabel,
+        ylabel=ylabel,
+        figsize=figsize,
+        color=color,
+        rotation=rotation,
+    )
+
+
 def create_pie_chart(
     df: pd.DataFrame,
     labels: str,
@@ -141,9 +244,12 @@ def create_pie_chart(
 
     fig, ax = plt.subplots(figsize=figsize)
 
+    vals = df[values].to_numpy()
+    label_values = df[labels].to_numpy()
+
     ax.pie(
-        df[values],
-        labels=df[labels],
+        vals,
+        labels=label_values,
         autopct=autopct,
         startangle=90,
         textprops={"fontsize": 10},
@@ -157,6 +263,39 @@ def create_pie_chart(
     return ax
 
 
+def create_pie_chart_arrow(
+    table: "pa.Table",
+    labels: str,
+    values: str,
+    title: str,
+    figsize: tuple = (10, 8),
+    autopct: str = "%1.1f%%",
+) -> plt.Axes:
+    """
+    Create a pie chart from a pyarrow Table (see create_pie_chart).
+
+    Parameters:
+    -----------
+    table : pa.Table
+        Data to visualize, e.g. from spark_to_arrow()
+    labels, values, title, figsize, autopct :
+        Same as in create_pie_chart
+
+    Returns:
+    --------
+    plt.Axes
+        Matplotlib axes object
+    """
+    return create_pie_chart(
+        _arrow_numpy_frame(table, [labels, values]),
+        labels,
+        values,
+        title,
+        figsize=figsize,
+        autopct=autopct,
+    )
+
+
 def create_scatter_plot(
     df: pd.DataFrame,
     x: str,
@@ -207,9 +346,11 @@ def create_scatter_plot(
     fig, ax = plt.subplots(figsize=figsize)
 
     if hue:
-        sns.scatterplot(data=df, x=x, y=y, hue=hue, alpha=alpha, ax=ax)
+        plot_df = _numpy_frame(df, [x, y, hue])
+        sns.scatterplot(data=plot_df, x=x, y=y, hue=hue, alpha=alpha, ax=ax)
     else:
-        sns.scatterplot(data=df, x=x, y=y, alpha=alpha, ax=ax)
+        plot_df = _numpy_frame(df, [x, y])
+        sns.scatterplot(data=plot_df, x=x, y=y, alpha=alpha, ax=ax)
 
     ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
     ax.set_xlabel(xlabel if xlabel else x, fontsize=12)
@@ -322,9 +463,11 @@ def create_line_plot(
     fig, ax = plt.subplots(figsize=figsize)
 
     if hue:
-        sns.lineplot(data=df, x=x, y=y, hue=hue, marker=marker, ax=ax)
+        plot_df = _numpy_frame(df, [x, y, hue])
+        sns.lineplot(data=plot_df, x=x, y=y, hue=hue, marker=marker, ax=ax)
     else:
-        sns.lineplot(data=df, x=x, y=y, marker=marker, ax=ax)
+        plot_df = _numpy_frame(df, [x, y])
+        sns.lineplot(data=plot_df, x=x, y=y, marker=marker, ax=ax)
 
     ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
     ax.set_xlabel(xlabel if xlabel else x, fontsize=12)
@@ -335,6 +478,46 @@ def create_line_plot(
     return ax
 
 
+def create_line_plot_arrow(
+    table: "pa.Table",
+    x: str,
+    y: str,
+    title: str,
+    xlabel: Optional[str] = None,
+    ylabel: Optional[str] = None,
+    hue: Optional[str] = None,
+    figsize: tuple = (12, 6),
+    marker: str = "o",
+) -> plt.Axes:
+    """
+    Create a line plot from a pyarrow Table (see create_line_plot).
+
+    Parameters:
+    -----------
+    table : pa.Table
+        Data to visualize, e.g. from spark_to_arrow()
+    x, y, title, xlabel, ylabel, hue, figsize, marker :
+        Same as in create_line_plot
+
+    Returns:
+    --------
+    plt.Axes
+        Matplotlib axes object
+    """
+    columns = [x, y, hue] if hue else [x, y]
+    return create_line_plot(
+        _arrow_numpy_frame(table, columns),
+        x,
+        y,
+        title,
+        xlabel=xlabel,
+        ylabel=ylabel,
+        hue=hue,
+        figsize=figsize,
+        marker=marker,
+    )
+
+
 def save_chart(ax: plt.Axes, filepath: str, dpi: int = 300) -> None:
     """
     Save a chart to file.